@@ -0,0 +1,94 @@
+import re
+
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.acounts.models import UserProfile
+
+_URL_RE = re.compile(r'^https?://[^\s/$.?#][^\s]*$', re.IGNORECASE)
+
+
+class UserProfileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UserProfile
+        fields = [
+            'id',
+            'user',
+            'bio',
+            'birth_date',
+            'profile_picture',
+            'phone_number',
+            'address',
+            'emergency_contact',
+            'join_date',
+            'nationality',
+            'blood_group',
+            'facebook_url',
+            'linkedin_url',
+            'is_active_profile',
+        ]
+        read_only_fields = ['user']
+
+    def _validate_url(self, value):
+        if value and not _URL_RE.match(value):
+            raise serializers.ValidationError("Enter a valid URL.")
+        return value
+
+    def validate_facebook_url(self, value):
+        return self._validate_url(value)
+
+    def validate_linkedin_url(self, value):
+        return self._validate_url(value)
+
+
+def add_role_claims(token, user):
+    # Signed role claims let permission checks read request.auth instead of the
+    # user row; they are re-read from the user on every refresh
+    token['role'] = user.role
+    token['is_super'] = user.is_super
+
+
+class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        add_role_claims(token, user)
+        return token
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        # Same flow as TokenRefreshSerializer.validate(), but the user it loads
+        # for the active check also refreshes the role claims
+        refresh = self.token_class(attrs['refresh'])
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM, None)
+        user = get_user_model().objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                self.error_messages['no_active_account'],
+                'no_active_account',
+            )
+        add_role_claims(refresh, user)
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    # The blacklist app is not installed
+                    pass
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+
+            data['refresh'] = str(refresh)
+
+        return data
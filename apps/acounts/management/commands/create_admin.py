@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 
-from apps.acounts.models import User
+from apps.acounts.models import ROLE_SUPERADMIN, User
 
 print("create_admin command module loaded")
 
@@ -19,7 +19,7 @@ class Command(BaseCommand):
                 email=admin_email,
                 password=admin_password,
                 is_super=True,
-                role="superadmin",
+                role=ROLE_SUPERADMIN,
             )
             self.stdout.write(self.style.SUCCESS("Admin user created successfully"))
         else:
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='employee_id',
+            field=models.CharField(blank=True, max_length=32, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='student_id',
+            field=models.CharField(blank=True, max_length=32, null=True, unique=True),
+        ),
+    ]
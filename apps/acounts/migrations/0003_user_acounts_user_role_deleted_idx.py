@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-15 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0002_alter_user_employee_id_alter_user_student_id'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'is_deleted'], name='acounts_user_role_deleted_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-15 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0003_user_acounts_user_role_deleted_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['id'], name='student_profiles_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teacherprofile',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['id'], name='teacher_profiles_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['id'], name='user_profiles_active_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-15 10:48
+
+import apps.acounts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0004_studentprofile_student_profiles_active_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='profile_picture',
+            field=models.ImageField(blank=True, null=True, upload_to=apps.acounts.models.profile_picture_upload_to),
+        ),
+    ]
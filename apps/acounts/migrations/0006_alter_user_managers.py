@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-15 11:20
+
+import apps.acounts.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0005_alter_userprofile_profile_picture'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', apps.acounts.models.UserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-15 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0006_alter_user_managers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='facebook_url',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='linkedin_url',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+    ]
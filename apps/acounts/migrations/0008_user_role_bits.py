@@ -0,0 +1,46 @@
+# Generated by Django 6.0.1 on 2026-10-15 13:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+ROLE_BITS = {'superadmin': 1, 'admin': 2, 'teacher': 4, 'student': 8}
+
+
+def role_names_to_bits(apps, schema_editor):
+    # Rewrite names as digit strings so the column type change can cast them
+    User = apps.get_model('acounts', 'User')
+    for name, bit in ROLE_BITS.items():
+        User.objects.filter(role=name).update(role=str(bit))
+
+
+def role_bits_to_names(apps, schema_editor):
+    User = apps.get_model('acounts', 'User')
+    for name, bit in ROLE_BITS.items():
+        User.objects.filter(role=str(bit)).update(role=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0007_alter_userprofile_facebook_url_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(role_names_to_bits, role_bits_to_names),
+        migrations.AlterField(
+            model_name='studentprofile',
+            name='user',
+            field=models.OneToOneField(limit_choices_to={'role': 8}, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='teacherprofile',
+            name='user',
+            field=models.OneToOneField(limit_choices_to={'role': 4}, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.SmallIntegerField(choices=[(1, 'Superadmin'), (2, 'Admin'), (4, 'Teacher'), (8, 'Student')], default=8),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.1 on 2026-10-15 15:42
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# Split the old comma separated text into trimmed, non-empty array items.
+# Items longer than the new 50 character limit abort the migration rather
+# than being truncated; shorten them first.
+CSV_TO_ARRAY_SQL = r"""
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM teacher_profiles, unnest(regexp_split_to_array(btrim({column}), '\s*,\s*')) AS item
+        WHERE length(item) > 50
+    ) THEN
+        RAISE EXCEPTION 'teacher_profiles.{column} has items longer than 50 characters';
+    END IF;
+END
+$$;
+ALTER TABLE teacher_profiles
+    ALTER COLUMN {column} TYPE varchar(50)[]
+    USING array_remove(regexp_split_to_array(btrim({column}), '\s*,\s*'), '');
+"""
+ARRAY_TO_CSV_SQL = """
+ALTER TABLE teacher_profiles
+    ALTER COLUMN {column} TYPE text
+    USING array_to_string({column}, ', ');
+"""
+
+
+def csv_to_array(column, field):
+    return migrations.SeparateDatabaseAndState(
+        database_operations=[
+            migrations.RunSQL(
+                CSV_TO_ARRAY_SQL.format(column=column),
+                ARRAY_TO_CSV_SQL.format(column=column),
+            ),
+        ],
+        state_operations=[
+            migrations.AlterField(model_name='teacherprofile', name=column, field=field),
+        ],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0009_user_partial_unique_ids'),
+    ]
+
+    operations = [
+        csv_to_array(
+            'classes_assigned',
+            django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, help_text='Class names', size=None),
+        ),
+        csv_to_array(
+            'subjects_teaching',
+            django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, help_text='Subjects', size=None),
+        ),
+        migrations.AddIndex(
+            model_name='teacherprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['classes_assigned'], name='teacher_profiles_classes_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='teacherprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['subjects_teaching'], name='teacher_profiles_subjects_gin'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-16 10:05
+
+import apps.acounts.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acounts', '0010_teacher_profile_array_fields'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='profile_picture',
+            field=apps.acounts.models.ContentAddressedImageField(blank=True, null=True, upload_to=apps.acounts.models.profile_picture_upload_to),
+        ),
+    ]
@@ -1,70 +1,269 @@
-from django.db import models
-from django.contrib.auth.models import AbstractUser
-from apps.common.models import BaseModel
-from django.utils import timezone
-import uuid
+from django.db import IntegrityError, models, router, transaction
+from django.contrib.auth.models import AbstractUser, UserManager as AuthUserManager
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db.models.fields.files import ImageFieldFile
+from apps.common.models import ActiveManager, BaseModel, DeletedManager, SoftDeleteQuerySet
+import hashlib
+import os
+import threading
+import time
+
+ID_GENERATION_ATTEMPTS = 3
+ID_CONSTRAINTS = {
+    'employee_id': 'acounts_user_employee_id_uniq',
+    'student_id': 'acounts_user_student_id_uniq',
+}
+
+# Roles are stored as single bits so permission checks can test a mask
+ROLE_SUPERADMIN = 1
+ROLE_ADMIN = 2
+ROLE_TEACHER = 4
+ROLE_STUDENT = 8
+EMPLOYEE_ROLES = ROLE_SUPERADMIN | ROLE_ADMIN | ROLE_TEACHER
+CROCKFORD_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+ULID_RANDOM_BYTES = 10
+ULID_RANDOM_BATCH = 1024
+
+_random_pool = threading.local()
+
+
+def _reset_random_pool():
+    global _random_pool
+    _random_pool = threading.local()
+
+
+# A forked worker must not reuse the random bytes its parent already drew
+# (register_at_fork is POSIX-only; Windows has no fork)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_random_pool)
+
+
+def _ulid_randomness():
+    """Take 80 random bits from a per-thread pool refilled by one os.urandom() call per batch."""
+    pool = _random_pool
+    offset = getattr(pool, 'offset', None)
+    if offset is None or offset >= len(pool.buffer):
+        pool.buffer = os.urandom(ULID_RANDOM_BYTES * ULID_RANDOM_BATCH)
+        offset = 0
+    pool.offset = offset + ULID_RANDOM_BYTES
+    return int.from_bytes(pool.buffer[offset:offset + ULID_RANDOM_BYTES], 'big')
+
+
+def generate_ulid():
+    """
+    Generate a ULID: 48-bit millisecond timestamp + 80 bits of randomness,
+    encoded as 26 Crockford base32 characters.
+
+    ULIDs sort by creation time, so new IDs land at the right edge of the
+    unique index instead of splitting random B-tree pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | _ulid_randomness()
+    chars = []
+    for _ in range(26):
+        value, index = divmod(value, 32)
+        chars.append(CROCKFORD_BASE32[index])
+    return ''.join(reversed(chars))
+
+
+class UserQuerySet(models.QuerySet):
+    def with_profiles(self):
+        """Fetch every profile in the same query instead of one query per user."""
+        return self.select_related('userprofile', 'studentprofile', 'teacherprofile')
+
+
+class UserManager(AuthUserManager.from_queryset(UserQuerySet)):
+    pass
+
 
 class User(AbstractUser, BaseModel):
     ROLE_CHOICES = [
-        ('superadmin', 'Superadmin'),
-        ('admin', 'Admin'),
-        ('teacher', 'Teacher'),
-        ('student', 'Student'),
+        (ROLE_SUPERADMIN, 'Superadmin'),
+        (ROLE_ADMIN, 'Admin'),
+        (ROLE_TEACHER, 'Teacher'),
+        (ROLE_STUDENT, 'Student'),
     ]
+    _ROLE_DISPLAY = dict(ROLE_CHOICES)
     
-    role = models.CharField(
-        max_length=20,
+    role = models.SmallIntegerField(
         choices=ROLE_CHOICES,
-        default='student'
+        default=ROLE_STUDENT
     )
     
     is_super = models.BooleanField(default=False)
-    employee_id = models.CharField(max_length=20, unique=True, blank=True, null=True)
-    student_id = models.CharField(max_length=20, unique=True, blank=True, null=True)
+    # Uniqueness is enforced by partial constraints in Meta, which skip NULLs
+    employee_id = models.CharField(max_length=32, blank=True, null=True)
+    student_id = models.CharField(max_length=32, blank=True, null=True)
+    
+    objects = UserManager()
+    
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Also serves role-only filters via its leftmost column
+            models.Index(fields=['role', 'is_deleted'], name='acounts_user_role_deleted_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['employee_id'],
+                condition=models.Q(employee_id__isnull=False),
+                name='acounts_user_employee_id_uniq',
+            ),
+            models.UniqueConstraint(
+                fields=['student_id'],
+                condition=models.Q(student_id__isnull=False),
+                name='acounts_user_student_id_uniq',
+            ),
+        ]
     
     def save(self, *args, **kwargs):
         # Auto-generate IDs based on role
-        if not self.pk:  # Only for new users
-            if self.role in ['superadmin', 'admin', 'teacher'] and not self.employee_id:
-                self.employee_id = self.generate_employee_id()
-            elif self.role == 'student' and not self.student_id:
-                self.student_id = self.generate_student_id()
-        super().save(*args, **kwargs)
+        id_field = None if self.pk else self._generated_id_field()  # Only for new users
+        if id_field is None:
+            return super().save(*args, **kwargs)
+
+        # The unique constraint catches the rare collision, so no pre-insert lookup
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        for attempt in range(ID_GENERATION_ATTEMPTS):
+            self._assign_generated_id(id_field)
+            try:
+                with transaction.atomic(using=using):
+                    return super().save(*args, **kwargs)
+            except IntegrityError as exc:
+                # Only a clash on the generated ID is worth retrying
+                diag = getattr(exc.__cause__, 'diag', None)
+                if getattr(diag, 'constraint_name', None) != ID_CONSTRAINTS[id_field]:
+                    raise
+                if attempt == ID_GENERATION_ATTEMPTS - 1:
+                    raise
+    
+    @classmethod
+    def bulk_create_with_ids(cls, users, batch_size=1000):
+        """
+        Insert users in batches, generating their role-based IDs up front.
+        
+        Conflicting rows are skipped by the database instead of being looked
+        up beforehand; users whose generated ID collided get a fresh one and
+        are retried. Inserted users get their primary keys set, so profiles
+        can be bulk-created for them afterwards. bulk_create() bypasses
+        save(), so passwords must already be hashed with set_password().
+        
+        Returns the users that could not be inserted (e.g. duplicate username).
+        """
+        failed = []
+        pending = [(user, user._generated_id_field()) for user in users]
+        db = cls.objects.db
+        with transaction.atomic(using=db):
+            for attempt in range(ID_GENERATION_ATTEMPTS):
+                for user, id_field in pending:
+                    if id_field:
+                        user._assign_generated_id(id_field)
+                cls.objects.bulk_create(
+                    [user for user, _ in pending], batch_size=batch_size, ignore_conflicts=True
+                )
+                rows = {
+                    username: (pk, employee_id, student_id)
+                    for pk, username, employee_id, student_id in cls.objects.filter(
+                        username__in=[user.username for user, _ in pending]
+                    ).values_list('id', 'username', 'employee_id', 'student_id')
+                }
+                retry = []
+                for user, id_field in pending:
+                    row = rows.get(user.username)
+                    if row is None and id_field:
+                        # Username is free, so the generated ID must have collided
+                        retry.append((user, id_field))
+                    elif row is not None and row[1:] == (user.employee_id, user.student_id):
+                        user.pk = row[0]
+                        user._state.adding = False
+                        user._state.db = db
+                    else:
+                        failed.append(user)
+                pending = retry
+                if not pending:
+                    break
+        return failed + [user for user, _ in pending]
+    
+    def _generated_id_field(self):
+        """Return the ID field this user should get auto-filled, if any."""
+        if self.role & EMPLOYEE_ROLES and not self.employee_id:
+            return 'employee_id'
+        if self.role & ROLE_STUDENT and not self.student_id:
+            return 'student_id'
+        return None
+    
+    def _assign_generated_id(self, id_field):
+        setattr(self, id_field, getattr(self, f'generate_{id_field}')())
     
     def generate_employee_id(self):
-        """Generate unique employee ID"""
-        import random
-        while True:
-            emp_id = f"EMP{random.randint(10000, 99999)}"
-            if not User.objects.filter(employee_id=emp_id).exists():
-                return emp_id
+        """Generate a time-ordered employee ID"""
+        return f"EMP{generate_ulid()}"
     
     def generate_student_id(self):
-        """Generate unique student ID"""
-        import random
-        while True:
-            std_id = f"STD{random.randint(10000, 99999)}"
-            if not User.objects.filter(student_id=std_id).exists():
-                return std_id
+        """Generate a time-ordered student ID"""
+        return f"STD{generate_ulid()}"
+    
+    def get_role_display(self):
+        # Overrides Django's version, which rebuilds a dict from the choices per call
+        return self._ROLE_DISPLAY.get(self.role, self.role)
     
     def __str__(self):
-        if self.role == 'student' and self.student_id:
+        if self.role & ROLE_STUDENT and self.student_id:
             return f"{self.username} ({self.get_role_display()}) - {self.student_id}"
-        elif self.role in ['superadmin', 'admin', 'teacher'] and self.employee_id:
+        elif self.role & EMPLOYEE_ROLES and self.employee_id:
             return f"{self.username} ({self.get_role_display()}) - {self.employee_id}"
         return f"{self.username} ({self.get_role_display()})"
     
+    @property
     def is_superuser_role(self):
-        return self.role == 'superuser'
+        return bool(self.role & ROLE_SUPERADMIN)
     
+    @property
     def is_admin_role(self):
-        return self.role == 'admin'
+        return bool(self.role & ROLE_ADMIN)
     
+    @property
     def is_teacher_role(self):
-        return self.role == 'teacher'
+        return bool(self.role & ROLE_TEACHER)
     
+    @property
     def is_student_role(self):
-        return self.role == 'student'
+        return bool(self.role & ROLE_STUDENT)
+
+
+class ContentAddressedImageFieldFile(ImageFieldFile):
+    def save(self, name, content, save=True):
+        # Hash the content actually being stored; this covers both
+        # FieldFile.save() calls and files assigned before model.save()
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        content_hash = digest.hexdigest()
+        extension = os.path.splitext(name)[1].lower()
+        hashed_name = f'{content_hash[:2]}/{content_hash}{extension}'
+        final_name = self.field.generate_filename(self.instance, hashed_name)
+        if not self.storage.exists(final_name):
+            return super().save(hashed_name, content, save)
+
+        # Identical content is already stored; point at it instead of writing a copy
+        self.name = final_name
+        setattr(self.instance, self.field.attname, self.name)
+        self._committed = True
+        if save:
+            self.instance.save()
+
+
+class ContentAddressedImageField(models.ImageField):
+    """
+    ImageField that names files by the SHA-256 of their content, so
+    identical images share one path and URLs can be cached as immutable.
+    """
+    attr_class = ContentAddressedImageFieldFile
+
+
+def profile_picture_upload_to(instance, filename):
+    """Place profile pictures, already named by content hash, under profile_pics/."""
+    return f'profile_pics/{filename}'
 
 
 class UserProfile(BaseModel):
@@ -73,7 +272,7 @@ class UserProfile(BaseModel):
     # Basic Info
     bio = models.TextField(max_length=500, blank=True)
     birth_date = models.DateField(null=True, blank=True)
-    profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
+    profile_picture = ContentAddressedImageField(upload_to=profile_picture_upload_to, null=True, blank=True)
     
     # Contact Info
     phone_number = models.CharField(max_length=15, blank=True)
@@ -86,12 +285,17 @@ class UserProfile(BaseModel):
     blood_group = models.CharField(max_length=5, blank=True)
     
     # Social Links (optional)
-    facebook_url = models.URLField(blank=True)
-    linkedin_url = models.URLField(blank=True)
+    # Plain CharFields; URL format is checked once in UserProfileSerializer
+    facebook_url = models.CharField(max_length=200, blank=True)
+    linkedin_url = models.CharField(max_length=200, blank=True)
     
     # Status
     is_active_profile = models.BooleanField(default=True)
     
+    objects = SoftDeleteQuerySet.as_manager()
+    active = ActiveManager()
+    deleted = DeletedManager()
+    
     def __str__(self):
         return f"{self.user.username}'s Profile"
     
@@ -99,10 +303,19 @@ class UserProfile(BaseModel):
         db_table = 'user_profiles'
         verbose_name = "User Profile"
         verbose_name_plural = "User Profiles"
+        indexes = [
+            models.Index(fields=['id'], condition=models.Q(is_deleted=False), name='user_profiles_active_idx'),
+        ]
+
+
+class StudentProfileQuerySet(SoftDeleteQuerySet):
+    def list_fields(self):
+        """Load only the columns list pages need, skipping the large text fields."""
+        return self.only('id', 'user', 'grade_level', 'section', 'roll_number')
 
 
 class StudentProfile(BaseModel):
-    user = models.OneToOneField(User, on_delete=models.CASCADE, limit_choices_to={'role': 'student'})
+    user = models.OneToOneField(User, on_delete=models.CASCADE, limit_choices_to={'role': ROLE_STUDENT})
     
     # Academic Info
     grade_level = models.CharField(max_length=20)
@@ -126,6 +339,10 @@ class StudentProfile(BaseModel):
     medical_conditions = models.TextField(blank=True)
     extracurricular_activities = models.TextField(blank=True)
     
+    objects = StudentProfileQuerySet.as_manager()
+    active = ActiveManager.from_queryset(StudentProfileQuerySet)()
+    deleted = DeletedManager.from_queryset(StudentProfileQuerySet)()
+    
     def __str__(self):
         return f"{self.user.username} - Grade {self.grade_level}"
     
@@ -133,10 +350,19 @@ class StudentProfile(BaseModel):
         db_table = 'student_profiles'
         verbose_name = "Student Profile"
         verbose_name_plural = "Student Profiles"
+        indexes = [
+            models.Index(fields=['id'], condition=models.Q(is_deleted=False), name='student_profiles_active_idx'),
+        ]
+
+
+class TeacherProfileQuerySet(SoftDeleteQuerySet):
+    def list_fields(self):
+        """Load only the columns list pages need, skipping the large text fields."""
+        return self.only('id', 'user', 'employee_code', 'department', 'subject_specialization')
 
 
 class TeacherProfile(BaseModel):
-    user = models.OneToOneField(User, on_delete=models.CASCADE, limit_choices_to={'role': 'teacher'})
+    user = models.OneToOneField(User, on_delete=models.CASCADE, limit_choices_to={'role': ROLE_TEACHER})
     
     # Professional Info
     employee_code = models.CharField(max_length=20, unique=True, blank=True)
@@ -159,17 +385,27 @@ class TeacherProfile(BaseModel):
     )
     
     # Teaching Details
-    classes_assigned = models.TextField(help_text="Comma separated class names", blank=True)
-    subjects_teaching = models.TextField(help_text="Comma separated subjects", blank=True)
+    classes_assigned = ArrayField(models.CharField(max_length=50), default=list, blank=True, help_text="Class names")
+    subjects_teaching = ArrayField(models.CharField(max_length=50), default=list, blank=True, help_text="Subjects")
     
     # Professional Development
     certifications = models.TextField(blank=True)
     training_completed = models.TextField(blank=True)
     
+    objects = TeacherProfileQuerySet.as_manager()
+    active = ActiveManager.from_queryset(TeacherProfileQuerySet)()
+    deleted = DeletedManager.from_queryset(TeacherProfileQuerySet)()
+    
     def __str__(self):
         return f"{self.user.username} - {self.department}"
     
     class Meta:
         db_table = 'teacher_profiles'
         verbose_name = "Teacher Profile"
-        verbose_name_plural = "Teacher Profiles"
\ No newline at end of file
+        verbose_name_plural = "Teacher Profiles"
+        indexes = [
+            models.Index(fields=['id'], condition=models.Q(is_deleted=False), name='teacher_profiles_active_idx'),
+            # Back __contains membership queries, e.g. subjects_teaching__contains=['Math']
+            GinIndex(fields=['classes_assigned'], name='teacher_profiles_classes_gin'),
+            GinIndex(fields=['subjects_teaching'], name='teacher_profiles_subjects_gin'),
+        ]
\ No newline at end of file
@@ -1,3 +1,180 @@
-from django.test import TestCase
+import hashlib
+import io
+import os
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.acounts.models import ROLE_ADMIN, ROLE_STUDENT, ROLE_TEACHER, User, UserProfile
+
+
+class UserIdGenerationTests(TestCase):
+    def test_save_retries_on_id_collision(self):
+        existing = User.objects.create_user(username='first', password='x', role=ROLE_TEACHER)
+
+        with mock.patch.object(
+            User, 'generate_employee_id', side_effect=[existing.employee_id, 'EMPFRESH']
+        ) as generate:
+            user = User.objects.create_user(username='second', password='x', role=ROLE_TEACHER)
+
+        self.assertEqual(generate.call_count, 2)
+        self.assertEqual(user.employee_id, 'EMPFRESH')
+        self.assertIsNotNone(user.pk)
+
+    def test_save_does_not_retry_other_integrity_errors(self):
+        User.objects.create_user(username='taken', password='x', role=ROLE_TEACHER)
+
+        with mock.patch.object(User, 'generate_employee_id', return_value='EMPNEW') as generate:
+            with self.assertRaises(IntegrityError):
+                User.objects.create_user(username='taken', password='x', role=ROLE_TEACHER)
+
+        self.assertEqual(generate.call_count, 1)
+
+
+class UserRolePredicateTests(TestCase):
+    def test_role_checks_follow_role_changes(self):
+        user = User.objects.create_user(username='teacher', password='x', role=ROLE_TEACHER)
+        self.assertTrue(user.is_teacher_role)
+
+        user.role = ROLE_ADMIN
+        self.assertTrue(user.is_admin_role)
+        self.assertFalse(user.is_teacher_role)
+
+        User.objects.filter(pk=user.pk).update(role=ROLE_STUDENT)
+        user.refresh_from_db()
+        self.assertTrue(user.is_student_role)
+
+
+def make_png(color):
+    buffer = io.BytesIO()
+    Image.new('RGB', (2, 2), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def expected_picture_name(data):
+    content_hash = hashlib.sha256(data).hexdigest()
+    return f'profile_pics/{content_hash[:2]}/{content_hash}.png'
+
+
+class ProfilePictureStorageTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.media_root = media_root.name
+        user = User.objects.create_user(username='pictured', password='x')
+        self.profile = UserProfile.objects.create(user=user)
+
+    def test_assigned_file_is_named_by_content_hash(self):
+        data = make_png('red')
+        self.profile.profile_picture = SimpleUploadedFile('Me.PNG', data)
+        self.profile.save()
+
+        self.assertEqual(self.profile.profile_picture.name, expected_picture_name(data))
+        self.assertEqual(self.profile.profile_picture.read(), data)
+
+    def test_field_file_save_hashes_new_content(self):
+        first, second = make_png('red'), make_png('blue')
+        self.profile.profile_picture.save('first.png', ContentFile(first))
+        self.assertEqual(self.profile.profile_picture.name, expected_picture_name(first))
+
+        self.profile.profile_picture.save('second.png', ContentFile(second))
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.profile_picture.name, expected_picture_name(second))
+
+    def test_identical_uploads_share_one_file(self):
+        data = make_png('green')
+        other = UserProfile.objects.create(
+            user=User.objects.create_user(username='twin', password='x')
+        )
+
+        self.profile.profile_picture = SimpleUploadedFile('one.png', data)
+        self.profile.save()
+        other.profile_picture.save('two.png', ContentFile(data))
+        other.refresh_from_db()
+
+        self.assertEqual(self.profile.profile_picture.name, expected_picture_name(data))
+        self.assertEqual(other.profile_picture.name, self.profile.profile_picture.name)
+        stored_dir = os.path.dirname(os.path.join(self.media_root, expected_picture_name(data)))
+        self.assertEqual(len(os.listdir(stored_dir)), 1)
+
+
+class BulkCreateWithIdsTests(TestCase):
+    def test_inserted_users_get_primary_keys(self):
+        users = [User(username='bulk-teacher', role=ROLE_TEACHER), User(username='bulk-student')]
+
+        failed = User.bulk_create_with_ids(users)
+
+        self.assertEqual(failed, [])
+        for user in users:
+            self.assertIsNotNone(user.pk)
+            self.assertFalse(user._state.adding)
+            self.assertEqual(User.objects.get(pk=user.pk).username, user.username)
+        self.assertTrue(users[0].employee_id.startswith('EMP'))
+        self.assertTrue(users[1].student_id.startswith('STD'))
+
+    def test_id_collision_is_retried(self):
+        existing = User.objects.create_user(username='first', password='x', role=ROLE_TEACHER)
+        user = User(username='second', role=ROLE_TEACHER)
+
+        with mock.patch.object(
+            User, 'generate_employee_id', side_effect=[existing.employee_id, 'EMPFRESH']
+        ):
+            failed = User.bulk_create_with_ids([user])
+
+        self.assertEqual(failed, [])
+        self.assertEqual(User.objects.get(pk=user.pk).employee_id, 'EMPFRESH')
+
+    def test_duplicate_username_is_returned_without_retrying(self):
+        User.objects.create_user(username='taken', password='x')
+        duplicate = User(username='taken', role=ROLE_TEACHER)
+        fresh = User(username='fresh', role=ROLE_TEACHER)
+
+        with mock.patch.object(
+            User, 'generate_employee_id', side_effect=['EMPDUP', 'EMPFRESH']
+        ) as generate:
+            failed = User.bulk_create_with_ids([duplicate, fresh])
+
+        self.assertEqual(failed, [duplicate])
+        self.assertIsNone(duplicate.pk)
+        self.assertIsNotNone(fresh.pk)
+        self.assertEqual(generate.call_count, 2)
+        self.assertEqual(User.objects.filter(username='taken').count(), 1)
+
+
+class TokenRoleClaimTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='staff', password='pw', role=ROLE_ADMIN)
+        response = self.client.post('/api/token/', {'username': 'staff', 'password': 'pw'})
+        self.tokens = response.json()
+
+    def refresh(self):
+        return self.client.post('/api/token/refresh/', {'refresh': self.tokens['refresh']})
+
+    def test_obtain_includes_role_claims(self):
+        access = AccessToken(self.tokens['access'])
+        self.assertEqual(access['role'], ROLE_ADMIN)
+        self.assertFalse(access['is_super'])
+
+    def test_refresh_reloads_role_claims(self):
+        User.objects.filter(pk=self.user.pk).update(role=ROLE_TEACHER, is_super=True)
+
+        response = self.refresh()
+
+        self.assertEqual(response.status_code, 200)
+        access = AccessToken(response.json()['access'])
+        self.assertEqual(access['role'], ROLE_TEACHER)
+        self.assertTrue(access['is_super'])
+
+    def test_refresh_rejects_inactive_user(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        self.assertEqual(self.refresh().status_code, 401)
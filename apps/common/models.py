@@ -1,23 +1,62 @@
 """
-Abstract base models for Django projects.
-These models provide common fields for auditing, timestamps, and soft delete functionality.
+Abstract base model and soft-delete managers for Django projects.
+BaseModel provides common fields for auditing, timestamps, and soft delete functionality.
 """
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
 
 
-class TimestampModel(models.Model):
+class BaseModel(models.Model):
     """
-    Abstract model that provides timestamp fields.
+    Complete abstract base model providing timestamps, auditing and soft delete.
     
-    Fields:
+    The fields live on this single class rather than on separate abstract
+    mixins, which keeps the MRO of every model in the project short.
+    
+    Timestamp fields:
         - created_at: Automatically set when the object is first created
         - updated_at: Automatically updated whenever the object is saved
     
+    Audit fields:
+        - created_by: Foreign key to the user who created the record
+        - updated_by: Foreign key to the user who last updated the record
+    
+    Both audit fields use settings.AUTH_USER_MODEL and are optional
+    (null=True) for system-generated records.
+    
+    Soft delete fields:
+        - is_deleted: Boolean flag indicating if the record is deleted
+        - deleted_at: Timestamp when the record was deleted
+    
+    Instead of actually deleting records from the database, soft delete
+    marks them as deleted. This is useful for:
+        - Data recovery
+        - Audit trails
+        - Maintaining referential integrity
+        - Compliance requirements
+    
+    This is the recommended base class for most models in your project.
+    
     Usage:
-        class MyModel(TimestampModel):
+        from apps.common.models import BaseModel
+        
+        class Product(BaseModel):
             name = models.CharField(max_length=100)
+            price = models.DecimalField(max_digits=10, decimal_places=2)
+            
+        # All audit fields are automatically included:
+        product = Product.objects.create(
+            name="Laptop",
+            price=999.99,
+            created_by=request.user
+        )
+        
+        # Soft delete
+        product.soft_delete()
+        
+        # Get only active (not deleted) records
+        active_products = Product.objects.filter(is_deleted=False)
     """
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -31,27 +70,6 @@ class TimestampModel(models.Model):
         blank=True,
         help_text="Timestamp when the record was last updated"
     )
-
-    class Meta:
-        abstract = True  # This model won't create a database table
-        ordering = ['-created_at']  # Default ordering by newest first
-
-
-class AuditModel(models.Model):
-    """
-    Abstract model that tracks who created and updated records.
-    
-    Fields:
-        - created_by: Foreign key to the user who created the record
-        - updated_by: Foreign key to the user who last updated the record
-    
-    Note: Uses settings.AUTH_USER_MODEL to reference your User model.
-    Both fields are optional (null=True) for system-generated records.
-    
-    Usage:
-        class MyModel(AuditModel):
-            name = models.CharField(max_length=100)
-    """
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -68,37 +86,6 @@ class AuditModel(models.Model):
         related_name='%(class)s_updated',
         help_text="User who last updated this record"
     )
-
-    class Meta:
-        abstract = True
-
-
-class SoftDeleteModel(models.Model):
-    """
-    Abstract model that provides soft delete functionality.
-    
-    Fields:
-        - is_deleted: Boolean flag indicating if the record is deleted
-        - deleted_at: Timestamp when the record was deleted
-    
-    Instead of actually deleting records from the database, this model
-    allows you to mark them as deleted. This is useful for:
-        - Data recovery
-        - Audit trails
-        - Maintaining referential integrity
-        - Compliance requirements
-    
-    Usage:
-        class MyModel(SoftDeleteModel):
-            name = models.CharField(max_length=100)
-        
-        # Soft delete
-        obj = MyModel.objects.get(id=1)
-        obj.delete()  # or obj.soft_delete()
-        
-        # Get only active (not deleted) records
-        active_objects = MyModel.objects.filter(is_deleted=False)
-    """
     is_deleted = models.BooleanField(
         default=False,
         db_index=True,  # Index for faster queries
@@ -111,54 +98,46 @@ class SoftDeleteModel(models.Model):
     )
 
     class Meta:
-        abstract = True
+        abstract = True  # This model won't create a database table
+        # No default ordering: call .order_by('-created_at') where newest-first matters
 
     def soft_delete(self):
         """Mark the record as deleted without removing it from database."""
         self.is_deleted = True
         self.deleted_at = timezone.now()
-        self.save()
+        self.save(update_fields=['is_deleted', 'deleted_at', 'updated_at'])
 
     def restore(self):
         """Restore a soft-deleted record."""
         self.is_deleted = False
         self.deleted_at = None
-        self.save()
+        self.save(update_fields=['is_deleted', 'deleted_at', 'updated_at'])
 
 
-class BaseModel(TimestampModel, AuditModel, SoftDeleteModel):
+class SoftDeleteQuerySet(models.QuerySet):
     """
-    Complete abstract base model combining all audit functionality.
+    QuerySet with bulk soft delete / restore.
     
-    Includes:
-        - created_at, updated_at (from TimestampModel)
-        - created_by, updated_by (from AuditModel)
-        - is_deleted, deleted_at (from SoftDeleteModel)
-    
-    This is the recommended base class for most models in your project.
+    Both methods issue a single UPDATE for all matched rows and, like
+    QuerySet.update(), skip save() and the pre/post_save signals, so they
+    set updated_at themselves.
     
     Usage:
-        from .base_models import BaseModel
-        
-        class Product(BaseModel):
-            name = models.CharField(max_length=100)
-            price = models.DecimalField(max_digits=10, decimal_places=2)
-            
-        # All audit fields are automatically included:
-        product = Product.objects.create(
-            name="Laptop",
-            price=999.99,
-            created_by=request.user
-        )
+        Product.active.filter(price__lt=10).soft_delete()
+        Product.deleted.all().restore()
     """
-    
-    class Meta:
-        abstract = True
-        ordering = ['-created_at']
+    def soft_delete(self):
+        """Mark every record in the queryset as deleted."""
+        now = timezone.now()
+        return self.update(is_deleted=True, deleted_at=now, updated_at=now)
+
+    def restore(self):
+        """Restore every soft-deleted record in the queryset."""
+        return self.update(is_deleted=False, deleted_at=None, updated_at=timezone.now())
 
 
 # Optional: Custom Manager for filtering out soft-deleted records by default
-class ActiveManager(models.Manager):
+class ActiveManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
     """
     Custom manager that excludes soft-deleted records by default.
     
@@ -174,12 +153,31 @@ class ActiveManager(models.Manager):
         
         # Get only active products
         active_products = Product.active.all()
+    
+    On PostgreSQL, pair it with a partial index on live rows so these
+    queries scan an index sized to the active records only:
+    
+        class Meta:
+            indexes = [
+                models.Index(
+                    fields=['id'],
+                    condition=models.Q(is_deleted=False),
+                    name='products_active_idx',
+                ),
+            ]
+    
+    Keep the unfiltered manager declared first and do not use this one as
+    Meta.base_manager_name: Django uses the base manager for reverse
+    relations, refresh_from_db(), update_fields saves and delete cascades,
+    so a filtering base manager breaks restore() and leaves soft-deleted
+    children behind when a parent is hard-deleted. Filter reverse lookups
+    explicitly instead, e.g. Product.active.filter(owner=user).
     """
     def get_queryset(self):
         return super().get_queryset().filter(is_deleted=False)
 
 
-class DeletedManager(models.Manager):
+class DeletedManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
     """
     Custom manager that returns only soft-deleted records.
     
@@ -1,3 +1,38 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
+
+from apps.acounts.models import User, UserProfile
+
+
+class SoftDeleteTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='owner', password='x')
+        self.profile = UserProfile.objects.create(user=user)
+        self.stale = timezone.now() - timedelta(days=1)
+        UserProfile.objects.filter(pk=self.profile.pk).update(updated_at=self.stale)
+
+    def test_soft_delete_and_restore_bump_updated_at(self):
+        self.profile.soft_delete()
+        self.profile.refresh_from_db()
+        self.assertTrue(self.profile.is_deleted)
+        self.assertGreater(self.profile.updated_at, self.stale)
+
+        UserProfile.objects.filter(pk=self.profile.pk).update(updated_at=self.stale)
+        self.profile.restore()
+        self.profile.refresh_from_db()
+        self.assertFalse(self.profile.is_deleted)
+        self.assertGreater(self.profile.updated_at, self.stale)
+
+    def test_queryset_soft_delete_and_restore_bump_updated_at(self):
+        self.assertEqual(UserProfile.active.all().soft_delete(), 1)
+        self.profile.refresh_from_db()
+        self.assertTrue(self.profile.is_deleted)
+        self.assertGreater(self.profile.updated_at, self.stale)
 
-# Create your tests here.
+        UserProfile.objects.filter(pk=self.profile.pk).update(updated_at=self.stale)
+        self.assertEqual(UserProfile.deleted.all().restore(), 1)
+        self.profile.refresh_from_db()
+        self.assertFalse(self.profile.is_deleted)
+        self.assertGreater(self.profile.updated_at, self.stale)